@@ -10,17 +10,153 @@ This program is not open source. See <https://github.com/VladinXXV/VladinXXV/blo
 """
 
 # Imports
-import random as rng
+import concurrent.futures
+import itertools
+import os
+import secrets
 import string as txt
+import sys
+
+# NumPy is optional; when present it vectorizes the byte-to-character mapping for very long keys
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+# A module-level CSPRNG backed by the OS; draws fall back to it when the pool is too large to be
+# indexed by single bytes
+_sysrand = secrets.SystemRandom()
+
+# Draws at least this long are handed to the NumPy fast path when it is available
+_BULK_THRESHOLD = 1024
+
+# Canonical character sets, built once at import; main() copies these instead of reconstructing
+# them from the string module on every reset
+_DIGITS = tuple(txt.digits)
+_LETTERS = tuple(txt.ascii_letters)
+_PUNCT = tuple(txt.punctuation)
+
+# The welcome banner, assembled once at import so main() can write it with a single call
+_BANNER = "\n\n\n" + "\n".join((
+	"╔══════════════════════════════════════════════════╗",
+	"║░░░░░░░░░░░░░████████░░░░░░░░░░░░░░░░░░░░░░░░░░░░░║",
+	"║░░░░░░░░░░░██░░░░░░░░██░░░░░░░░░░░░░░░░░░░░░░░░░░░║",
+	"║░░░░░░░░░██░░░░░░░░░░░░██████████████████░░░░░░░░░║",
+	"║░░░░░░░░░██░░████░░░░░░░░░░░░░░░░░░░░░░██░░░░░░░░░║",
+	"║░░░░░░░░░██░░████░░░░░░░░░░██░░██░░██░░██░░░░░░░░░║",
+	"║░░░░░░░░░██░░░░░░░░░░░░████░░██░░██░░██░░░░░░░░░░░║",
+	"║░░░░░░░░░░░██░░░░░░░░██░░░░░░░░░░░░░░░░░░░░░░░░░░░║",
+	"║░░░░░░░░░░░░░████████░░░░░░░░░░░░░░░░░░░░░░░░░░░░░║",
+	"╠══════════════════════════════════════════════════╣",
+	"║Welcome to KEYGEN! Thank you for using my program!║",
+	"║                                   -VladinXXV     ║",
+	"╚══════════════════════════════════════════════════╝",
+)) + "\n\n\n"
 
 # Function Definitions
+def _randomCharactersBulk(pool, count):
+	"""
+    NumPy fast path for _randomCharacters(), used for long draws.
+
+    Applies the same rejection sampling over bulk os.urandom bytes as the generic path, but with
+	the accept test and index arithmetic vectorized over whole byte buffers instead of running per
+	character in bytecode.
+
+    Args:
+        pool (str): The characters to draw from. Must encode to one byte per character.
+        count (int): The number of characters to draw.
+
+    Returns:
+        str: The drawn characters.
+    """
+
+	poolArray = numpy.frombuffer(pool.encode('latin-1'), dtype = numpy.uint8)
+	cutoff = 256 - (256 % poolArray.size)
+	pieces = []
+	remaining = count
+	while remaining > 0:
+		randomBytes = numpy.frombuffer(os.urandom(remaining * 2), dtype = numpy.uint8)
+		accepted = randomBytes[randomBytes < cutoff][:remaining]
+		# A full 256-entry pool accepts every byte as-is; reducing it with a modulus of 256 would
+		# overflow the uint8 arithmetic anyway
+		if cutoff < 256:
+			accepted = accepted % poolArray.size
+		pieces.append(poolArray[accepted])
+		remaining -= accepted.size
+	return numpy.concatenate(pieces).tobytes().decode('latin-1')
+
+
+def _randomCharacters(pool, count):
+	"""
+    Draws count characters uniformly from pool using bulk OS randomness.
+
+    Reads random bytes from the OS in one batch per refill and maps them to pool indices with
+	rejection sampling, so no modulo bias is introduced and the RNG is only invoked a handful of
+	times instead of once per character.
+
+    Args:
+        pool (str): The characters to draw from.
+        count (int): The number of characters to draw.
+
+    Returns:
+        str: The drawn characters.
+    """
+
+	poolSize = len(pool)
+
+	# A pool longer than 256 (possible with duplicate characters) cannot be indexed by single
+	# bytes -- the rejection cutoff below would be 0 and accept nothing in any byte-mapped path,
+	# vectorized or not -- so draw each character straight from the CSPRNG instead
+	if poolSize > 256:
+		return ''.join(_sysrand.choice(pool) for _ in range(count))
+
+	# Hand long draws to the vectorized path; fall through if the pool holds characters that do
+	# not fit in one byte, which the generic paths below handle fine
+	if numpy != None and count >= _BULK_THRESHOLD:
+		try:
+			return _randomCharactersBulk(pool, count)
+		except UnicodeEncodeError:
+			pass
+
+	# Reject bytes at or above the cutoff so the remaining range divides evenly into the pool
+	cutoff = 256 - (256 % poolSize)
+
+	# When the pool fits one byte per character, write into a preallocated buffer and decode it
+	# once, instead of collecting one small string object per character
+	try:
+		poolBytes = pool.encode('latin-1')
+	except UnicodeEncodeError:
+		poolBytes = None
+	if poolBytes != None:
+		drawn = bytearray(count)
+		filled = 0
+		while filled < count:
+			for byte in os.urandom((count - filled) * 2):
+				if byte < cutoff:
+					drawn[filled] = poolBytes[byte % poolSize]
+					filled += 1
+					if filled == count:
+						break
+		return drawn.decode('latin-1')
+
+	# Fallback for pools holding characters wider than one byte
+	characters = []
+	while len(characters) < count:
+		for byte in os.urandom((count - len(characters)) * 2):
+			if byte < cutoff:
+				characters.append(pool[byte % poolSize])
+				if len(characters) == count:
+					break
+	return ''.join(characters)
+
+
 def blacklistCharacters(numbers: list, letters: list, symbols: list, blacklist: list = None, printToConsole: bool = False):
 	"""
     Removes characters from the provided lists based on a blacklist, for use with keygen().
 
     This function takes in three lists of characters (numbers, letters, symbols) and a blacklist of
-	characters. It removes any characters present in the blacklist from the numbers, letters, and
-	symbols lists. The blacklist is then updated to only include characters that were not removed.
+	characters. It returns new lists with any blacklisted characters removed, rather than mutating
+	the lists it was given, along with a blacklist reduced to the characters that were not removed.
 
     Args:
         numbers (list): A list of number characters.
@@ -33,8 +169,8 @@ def blacklistCharacters(numbers: list, letters: list, symbols: list, blacklist:
 										 anyway.
 
     Returns:
-        list: The updated blacklist containing only characters that were not removed from the
-			  provided lists (numbers, letters, symbols).
+        tuple: The filtered numbers, letters, and symbols lists, plus the updated blacklist
+			   containing only characters that were not removed from them.
 
     Raises:
         TypeError: If printToConsole is False and blacklist is None.
@@ -46,9 +182,6 @@ def blacklistCharacters(numbers: list, letters: list, symbols: list, blacklist:
 					strings greater than length 1.
     """
 	
-	# Create a dictionary to store the list argument names and their corresponding values
-	listArgumentNames = {'numbers': numbers, 'letters': letters, 'symbols': symbols, 'blacklist': blacklist}
-
 	# Check the type of printToConsole, it should be a boolean
 	if not isinstance(printToConsole, bool):
 		raise TypeError("Input argument 'printToConsole' has incorrect type. Must be 'bool'.")
@@ -61,27 +194,37 @@ def blacklistCharacters(numbers: list, letters: list, symbols: list, blacklist:
 	listFails = []
 	characterFails = []
 
-	# Check that all list arguments are lists and contain only single-character strings
-	for listArgumentName, listArgument in listArgumentNames.items():
-		if listArgumentName != 'blacklist':
-			if not isinstance(listArgument, list):
-				listFails.append(listArgumentName)
-		if listArgument != None and not all(isinstance(string, str) and len(string) == 1 for string in listArgument):
-			characterFails.append(listArgumentName)
+	# Check that all list arguments are lists and contain only single-character strings.
+	# str.join runs in C and rejects non-string elements, and the joined length only matches the
+	# list length if every element is a single character -- except that empty strings can offset
+	# longer ones, so they are rejected separately.
+	for listArgumentName, listArgument in (('numbers', numbers), ('letters', letters), ('symbols', symbols), ('blacklist', blacklist)):
+		if listArgumentName != 'blacklist' and not isinstance(listArgument, list):
+			listFails.append(listArgumentName)
+		elif listArgument != None:
+			try:
+				if len(''.join(listArgument)) != len(listArgument) or '' in listArgument:
+					characterFails.append(listArgumentName)
+			except TypeError:
+				characterFails.append(listArgumentName)
 
 	# If any list arguments are not lists, raise a TypeError
 	if listFails:
-		raise TypeError(f"Input argument(s): {', '.join(f'{chr(39)}{listFailure}{chr(39)}' for listFailure in listFails)} have incorrect type(s). Must be 'list'.")
+		failedNames = ', '.join(map("'{}'".format, listFails))
+		raise TypeError(f"Input argument(s): {failedNames} have incorrect type(s). Must be 'list'.")
 
 	# If any list arguments contain strings greater than length 1, raise a ValueError
 	if characterFails:
-		raise ValueError(f"Input argument(s): {', '.join(f'{chr(39)}{characterFailure}{chr(39)}' for characterFailure in characterFails)} contain strings greater than length 1. Must contain only single-character strings.")
+		failedNames = ', '.join(map("'{}'".format, characterFails))
+		raise ValueError(f"Input argument(s): {failedNames} contain strings greater than length 1. Must contain only single-character strings.")
 
-	# If printToConsole is True, prompt the user to input the blacklist if it wasn't given already
+	# If printToConsole is True, prompt the user to input the blacklist if it wasn't given already.
+	# The allowed pool does not change between retries, so its union is built once outside the loop.
 	if printToConsole and not isinstance(blacklist, list):
+		allowedSet = set(numbers) | set(letters) | set(symbols)
 		while True:
 			blacklist = list(input("Enter all English ASCII letters, punctuation (bar whitespace), and/or digits prohibited from being in your password:\n"))
-			if len((set(numbers) | set(letters) | set(symbols)) - set(blacklist)) == 0:
+			if not (allowedSet - set(blacklist)):
 				print("You must allow at least one character to be used to generate a key.")
 			else:
 				break
@@ -89,33 +232,33 @@ def blacklistCharacters(numbers: list, letters: list, symbols: list, blacklist:
 	elif blacklist == None:
 		raise TypeError("Input argument 'blacklist' cannot be None if the argument 'printToConsole' is False. Must be 'list' or 'printToConsole' must be True.")
 	
-	# Convert lists to sets for efficient operations
-	numbersSet = set(numbers)
-	lettersSet = set(letters)
-	symbolsSet = set(symbols)
-	blacklistSet = set(blacklist)
-
-	# Remove the blacklist characters from the numbers, letters, and symbols sets
-	numbersSet -= blacklistSet
-	lettersSet -= blacklistSet
-	symbolsSet -= blacklistSet
-
-	# Update the blacklist to only include characters that were not removed
-	blacklistSet = blacklistSet - (set(numbers) | set(letters) | set(symbols))
-
-	# Convert the sets back to lists
-	numbers[:] = list(numbersSet)
-	letters[:] = list(lettersSet)
-	symbols[:] = list(symbolsSet)
-	blacklist[:] = list(blacklistSet)
+	# Join each character set once; the same strings feed both the residual-blacklist update and
+	# the filtering below
+	numbersString = ''.join(numbers)
+	lettersString = ''.join(letters)
+	symbolsString = ''.join(symbols)
+
+	# Build a translation table that deletes every blacklisted character; str.translate then strips
+	# each character set in a single C loop instead of Python-level set arithmetic
+	translationTable = str.maketrans('', '', ''.join(blacklist))
+
+	# Update the blacklist to only include characters that were not removed, reusing the joined
+	# strings instead of concatenating and rehashing the lists
+	blacklist = list(set(blacklist).difference(numbersString, lettersString, symbolsString))
+
+	# Build fresh lists of the surviving characters; one allocation each, and the caller's lists
+	# are never aliased or resized behind its back
+	numbers = list(numbersString.translate(translationTable))
+	letters = list(lettersString.translate(translationTable))
+	symbols = list(symbolsString.translate(translationTable))
 	
 	# If there are any characters left in the blacklist and printToConsole is True, print these
 	# characters
 	if len(blacklist) > 0 and printToConsole:
 		print(f"The characters:\n\t{''.join(blacklist)}\n...were not blacklisted because they were not going to be used anyway.")
 
-	# Return whatever remains of the blacklist, if anything
-	return blacklist
+	# Return the filtered character sets and whatever remains of the blacklist, if anything
+	return numbers, letters, symbols, blacklist
 			
 
 def keygen(numbers: list, letters: list, symbols: list, keyLength: int = None, printToConsole: bool = False):
@@ -147,9 +290,6 @@ def keygen(numbers: list, letters: list, symbols: list, keyLength: int = None, p
         ValueError: If all character sets are empty.
     """
 
-	# Create a dictionary to store the list argument names and their corresponding values
-	listArgumentNames = {'numbers': numbers, 'letters': letters, 'symbols': symbols}
-
 	# Check the type of printToConsole, it should be a boolean
 	if not isinstance(printToConsole, bool):
 		raise TypeError("Input argument 'printToConsole' has incorrect type. Must be 'bool'.")
@@ -162,31 +302,37 @@ def keygen(numbers: list, letters: list, symbols: list, keyLength: int = None, p
 	listFails = []
 	characterFails = []
 
-	# Check that all list arguments are lists and contain only single-character strings
-	for listArgumentName, listArgument in listArgumentNames.items():
+	# Check that all list arguments are lists and contain only single-character strings.
+	# str.join runs in C and rejects non-string elements, and the joined length only matches the
+	# list length if every element is a single character -- except that empty strings can offset
+	# longer ones, so they are rejected separately.
+	for listArgumentName, listArgument in (('numbers', numbers), ('letters', letters), ('symbols', symbols)):
 		if not isinstance(listArgument, list):
 			listFails.append(listArgumentName)
-		if not all(isinstance(string, str) and len(string) == 1 for string in listArgument):
+			continue
+		try:
+			if len(''.join(listArgument)) != len(listArgument) or '' in listArgument:
+				characterFails.append(listArgumentName)
+		except TypeError:
 			characterFails.append(listArgumentName)
 
 	# If any list arguments are not lists, raise a TypeError
 	if listFails:
-		raise TypeError(f"Input argument(s): {', '.join(f'{chr(39)}{listFailure}{chr(39)}' for listFailure in listFails)} have incorrect type(s). Must be 'list'.")
+		failedNames = ', '.join(map("'{}'".format, listFails))
+		raise TypeError(f"Input argument(s): {failedNames} have incorrect type(s). Must be 'list'.")
 
 	# If any list arguments contain strings greater than length 1, raise a ValueError
 	if characterFails:
-		raise ValueError(f"Input argument(s): {', '.join(f'{chr(39)}{characterFailure}{chr(39)}' for characterFailure in characterFails)} contain strings greater than length 1. Must contain only single-character strings.")
+		failedNames = ', '.join(map("'{}'".format, characterFails))
+		raise ValueError(f"Input argument(s): {failedNames} contain strings greater than length 1. Must contain only single-character strings.")
 
-	# If printToConsole is True, prompt the user to input the keyLength
+	# If printToConsole is True, prompt the user to input the keyLength. A keyLength that is
+	# already valid skips the prompt loop entirely instead of re-checking it every iteration.
 	if printToConsole:
-		while True:
-			if keyLength != None and keyLength > 0:
-					break
+		while keyLength == None or keyLength <= 0:
 			try:
 				keyLength = int(input("Enter the desired length of your password (integer > 0):\n"))
-				if keyLength > 0:
-					break
-				else:
+				if keyLength <= 0:
 					print("Invalid input. Please enter a positive integer.")
 			except ValueError:
 				print("Invalid input. Please enter a positive integer.")
@@ -201,25 +347,167 @@ def keygen(numbers: list, letters: list, symbols: list, keyLength: int = None, p
 	if not numbers and not letters and not symbols:
 		raise ValueError("All character sets are empty. At least one character set must contain characters.")
 
-	# Initialize the key as an empty list
-	key = []
+	# Flatten the character sets into one contiguous string so every character is equally likely
+	# and each draw is a single indexed lookup into one compact buffer
+	pool = ''.join(itertools.chain(numbers, letters, symbols))
+
+	# Generate the key from bulk OS randomness, amortizing the RNG calls across all characters
+	key = _randomCharacters(pool, keyLength)
 
-	# Remove empty character sets
-	characterSets = [numbers, letters, symbols]
-	for characterSet in characterSets.copy():
-		if len(characterSet) == 0:
-			characterSets.remove(characterSet)
-	
-	# Generate the key by randomly selecting a character from a randomly selected character set
-	for keyCharacter in range(keyLength):
-		key.append(rng.choice(rng.choice(characterSets)))
-	
 	# If printToConsole is True, print the generated key
 	if printToConsole:
-		print(f"Your password is:\n{''.join(key)}\n")
-	
+		print(f"Your password is:\n{key}\n")
+
 	# Return the generated key as a string and keyLength as an integer in a tuple
-	return ''.join(key), keyLength
+	return key, keyLength
+
+
+def keygenBatch(numbers: list, letters: list, symbols: list, keyLength: int, count: int):
+	"""
+    Generates several pseudorandom passwords in one call.
+
+    This function validates its arguments like keygen(), then draws all count * keyLength
+	characters in one bulk request so the whole batch shares a single pass through the random
+	machinery (including the NumPy fast path when it is available) instead of paying the
+	per-call setup cost once per password.
+
+    Args:
+        numbers (list): A list of number characters.
+        letters (list): A list of letter characters.
+        symbols (list): A list of symbol characters.
+        keyLength (int): The desired length of each password.
+        count (int): The number of passwords to generate.
+
+    Returns:
+        list: The generated passwords as strings.
+
+    Raises:
+        TypeError: If keyLength or count is not an integer.
+        TypeError: If any of the list arguments (numbers, letters, symbols) are not lists.
+        ValueError: If any of the list arguments contain strings greater than length 1.
+        ValueError: If keyLength or count is less than 1.
+        ValueError: If all character sets are empty.
+    """
+
+	# Check the types of keyLength and count, they should be integers
+	if not isinstance(keyLength, int):
+		raise TypeError("Input argument 'keyLength' has incorrect type. Must be 'int'.")
+	if not isinstance(count, int):
+		raise TypeError("Input argument 'count' has incorrect type. Must be 'int'.")
+
+	# Initialize lists to store the names of list arguments that fail the type checks
+	listFails = []
+	characterFails = []
+
+	# Check that all list arguments are lists and contain only single-character strings.
+	# str.join runs in C and rejects non-string elements, and the joined length only matches the
+	# list length if every element is a single character -- except that empty strings can offset
+	# longer ones, so they are rejected separately.
+	for listArgumentName, listArgument in (('numbers', numbers), ('letters', letters), ('symbols', symbols)):
+		if not isinstance(listArgument, list):
+			listFails.append(listArgumentName)
+			continue
+		try:
+			if len(''.join(listArgument)) != len(listArgument) or '' in listArgument:
+				characterFails.append(listArgumentName)
+		except TypeError:
+			characterFails.append(listArgumentName)
+
+	# If any list arguments are not lists, raise a TypeError
+	if listFails:
+		failedNames = ', '.join(map("'{}'".format, listFails))
+		raise TypeError(f"Input argument(s): {failedNames} have incorrect type(s). Must be 'list'.")
+
+	# If any list arguments contain strings greater than length 1, raise a ValueError
+	if characterFails:
+		failedNames = ', '.join(map("'{}'".format, characterFails))
+		raise ValueError(f"Input argument(s): {failedNames} contain strings greater than length 1. Must contain only single-character strings.")
+
+	# Check the values of keyLength and count, they should be positive
+	if keyLength <= 0:
+		raise ValueError("Input argument 'keyLength' cannot be an integer less than 1. Must be an integer greater than 0.")
+	if count <= 0:
+		raise ValueError("Input argument 'count' cannot be an integer less than 1. Must be an integer greater than 0.")
+
+	# If all character sets are empty, raise a ValueError
+	if not numbers and not letters and not symbols:
+		raise ValueError("All character sets are empty. At least one character set must contain characters.")
+
+	# Flatten the character sets into one contiguous pool string
+	pool = ''.join(itertools.chain(numbers, letters, symbols))
+
+	# Draw every character for the whole batch at once, then slice the result into keys
+	allCharacters = _randomCharacters(pool, keyLength * count)
+	return [allCharacters[start:start + keyLength] for start in range(0, keyLength * count, keyLength)]
+
+
+def _batchWorker(arguments):
+	"""
+    Unpacks one worker's share of a parallel batch and runs keygenBatch() on it.
+
+    Args:
+        arguments (tuple): The numbers, letters, symbols, keyLength, and count for this worker.
+
+    Returns:
+        list: The generated passwords as strings.
+    """
+
+	numbers, letters, symbols, keyLength, count = arguments
+	return keygenBatch(numbers, letters, symbols, keyLength, count)
+
+
+def keygenParallel(numbers: list, letters: list, symbols: list, keyLength: int, count: int, workers: int = None):
+	"""
+    Generates a large batch of pseudorandom passwords across several processes.
+
+    This function splits the batch between worker processes, each of which runs keygenBatch()
+	on its own share; os.urandom hands every process an independent stream of OS randomness, so
+	no RNG state is shared between workers. Worthwhile when count is large enough for generation
+	to be CPU-bound; small batches are handed straight to keygenBatch().
+
+    Args:
+        numbers (list): A list of number characters.
+        letters (list): A list of letter characters.
+        symbols (list): A list of symbol characters.
+        keyLength (int): The desired length of each password.
+        count (int): The number of passwords to generate.
+        workers (int, optional): The number of worker processes. Defaults to the CPU count.
+
+    Returns:
+        list: The generated passwords as strings.
+
+    Raises:
+        TypeError: If keyLength, count, or workers is not an integer.
+        TypeError: If any of the list arguments (numbers, letters, symbols) are not lists.
+        ValueError: If any of the list arguments contain strings greater than length 1.
+        ValueError: If keyLength, count, or workers is less than 1.
+        ValueError: If all character sets are empty.
+    """
+
+	# Check the types and values of count and workers; keygenBatch validates everything else
+	if not isinstance(count, int):
+		raise TypeError("Input argument 'count' has incorrect type. Must be 'int'.")
+	if count <= 0:
+		raise ValueError("Input argument 'count' cannot be an integer less than 1. Must be an integer greater than 0.")
+	if workers != None and not isinstance(workers, int):
+		raise TypeError("Input argument 'workers' has incorrect type. Must be 'int'.")
+	if workers == None:
+		workers = os.cpu_count() or 1
+	elif workers <= 0:
+		raise ValueError("Input argument 'workers' cannot be an integer less than 1. Must be an integer greater than 0.")
+
+	# A single worker, or a batch too small to split, does not need the process pool
+	if workers == 1 or count < workers:
+		return keygenBatch(numbers, letters, symbols, keyLength, count)
+
+	# Split the batch as evenly as possible, giving the remainder to the first worker
+	workerCounts = [count // workers] * workers
+	workerCounts[0] += count % workers
+
+	# Generate each share in its own process and chain the results back together in order
+	with concurrent.futures.ProcessPoolExecutor(max_workers = workers) as executor:
+		workerBatches = executor.map(_batchWorker, [(numbers, letters, symbols, keyLength, workerCount) for workerCount in workerCounts])
+	return list(itertools.chain.from_iterable(workerBatches))
 
 # If standalone...		
 if __name__ == '__main__':
@@ -251,28 +539,15 @@ if __name__ == '__main__':
     	"""
 
 		# Initialize character sets
-		numbers = list(txt.digits)
-		letters = list(txt.ascii_letters)
-		symbols = list(txt.punctuation)
-
-		# Welcome message
-		print("\n\n")
-		print("╔══════════════════════════════════════════════════╗")
-		print("║░░░░░░░░░░░░░████████░░░░░░░░░░░░░░░░░░░░░░░░░░░░░║")
-		print("║░░░░░░░░░░░██░░░░░░░░██░░░░░░░░░░░░░░░░░░░░░░░░░░░║")
-		print("║░░░░░░░░░██░░░░░░░░░░░░██████████████████░░░░░░░░░║")
-		print("║░░░░░░░░░██░░████░░░░░░░░░░░░░░░░░░░░░░██░░░░░░░░░║")
-		print("║░░░░░░░░░██░░████░░░░░░░░░░██░░██░░██░░██░░░░░░░░░║")
-		print("║░░░░░░░░░██░░░░░░░░░░░░████░░██░░██░░██░░░░░░░░░░░║")
-		print("║░░░░░░░░░░░██░░░░░░░░██░░░░░░░░░░░░░░░░░░░░░░░░░░░║")
-		print("║░░░░░░░░░░░░░████████░░░░░░░░░░░░░░░░░░░░░░░░░░░░░║")
-		print("╠══════════════════════════════════════════════════╣")
-		print("║Welcome to KEYGEN! Thank you for using my program!║")
-		print("║                                   -VladinXXV     ║")
-		print("╚══════════════════════════════════════════════════╝\n\n")
+		numbers = list(_DIGITS)
+		letters = list(_LETTERS)
+		symbols = list(_PUNCT)
+
+		# Welcome message, written in one call instead of a print per banner line
+		sys.stdout.write(_BANNER)
 
 		# Call blacklistCharacters function to remove blacklisted characters from character sets
-		blacklistCharacters(numbers, letters, symbols, printToConsole = True)
+		numbers, letters, symbols, blacklist = blacklistCharacters(numbers, letters, symbols, printToConsole = True)
 		# Call keygen function to generate a password and save the key and keyLength
 		key, keyLength = keygen(numbers, letters, symbols, printToConsole = True)
 
@@ -304,18 +579,18 @@ if __name__ == '__main__':
 				key, keyLength = keygen(numbers, letters, symbols, keyLength, True)
 			elif option == '3':
 				# Regenerate with the same length but a new blacklist (gotta reset character sets)
-				numbers = list(txt.digits)
-				letters = list(txt.ascii_letters)
-				symbols = list(txt.punctuation)
-				blacklistCharacters(numbers, letters, symbols, printToConsole = True)
+				numbers = list(_DIGITS)
+				letters = list(_LETTERS)
+				symbols = list(_PUNCT)
+				numbers, letters, symbols, blacklist = blacklistCharacters(numbers, letters, symbols, printToConsole = True)
 				key, keyLength = keygen(numbers, letters, symbols, keyLength, True)
 			elif option == '4':
 				# Regenerate but with completely new settings
 				keyLength = None
-				numbers = list(txt.digits)
-				letters = list(txt.ascii_letters)
-				symbols = list(txt.punctuation)
-				blacklistCharacters(numbers, letters, symbols, printToConsole = True)
+				numbers = list(_DIGITS)
+				letters = list(_LETTERS)
+				symbols = list(_PUNCT)
+				numbers, letters, symbols, blacklist = blacklistCharacters(numbers, letters, symbols, printToConsole = True)
 				key, keyLength = keygen(numbers, letters, symbols, keyLength, True)
 			elif option == '5':
 				# Exit the program